@@ -0,0 +1,97 @@
+'''
+Measures cold start: the time from `import pyRobinhood.Robinhood` to the
+moment the first _place_order request would go on the wire.
+
+Each sample runs in a fresh interpreter so imports are not cached. Login,
+account and instrument lookups hit the real API using the credentials in
+config/user_info.json, but the ORDERS request itself is intercepted right
+before it is sent, so no order is ever placed.
+
+Usage:
+	python3 -m benchmarks.startup [--runs N] [--prewarm]
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# Raised from the intercepted ORDERS query to stop before sending.
+class _OrderIntercepted(Exception):
+	pass
+
+'''
+Takes one sample in the current (fresh) interpreter and prints it as JSON.
+'''
+def _sample(prewarm):
+	start = time.perf_counter()
+
+	from pyRobinhood.Robinhood import Robinhood
+	imported = time.perf_counter()
+
+	from pyRobinhood.ConfigService import ConfigService
+	from pyRobinhood.Endpoints import Endpoints
+
+	robinhood = Robinhood()
+	api = robinhood._robinhood_api
+	query = api.query
+	timings = {}
+
+	def intercepting_query(endpoint, payload, headers):
+		if endpoint is Endpoints.ORDERS:
+			timings['order'] = time.perf_counter()
+			raise _OrderIntercepted()
+		return query(endpoint, payload, headers)
+	api.query = intercepting_query
+
+	user_info = ConfigService().get_user_info()
+	robinhood.login(user_info['username'], user_info['password'])
+	logged_in = time.perf_counter()
+
+	if prewarm:
+		robinhood.prewarm()
+
+	try:
+		robinhood._place_order(symbol='AAPL', type='limit',
+			time_in_force='gfd', trigger='immediate', price=1.00,
+			stop_price=None, quantity=1, side='buy')
+	except _OrderIntercepted:
+		pass
+
+	print(json.dumps({
+		'import': imported - start,
+		'login': logged_in - imported,
+		'order': timings['order'] - logged_in,
+		'total': timings['order'] - start
+	}))
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+	parser.add_argument('--runs', type=int, default=5)
+	parser.add_argument('--prewarm', action='store_true')
+	parser.add_argument('--sample', action='store_true',
+		help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.sample:
+		_sample(args.prewarm)
+		return
+
+	command = [sys.executable, '-m', 'benchmarks.startup', '--sample']
+	if args.prewarm:
+		command.append('--prewarm')
+
+	samples = []
+	for _ in range(args.runs):
+		output = subprocess.check_output(command)
+		samples.append(json.loads(output.decode().strip().splitlines()[-1]))
+
+	for key in ('import', 'login', 'order', 'total'):
+		values = [sample[key] * 1000 for sample in samples]
+		print("{:<7} median {:8.1f} ms  min {:8.1f} ms".format(key,
+			statistics.median(values), min(values)))
+
+if __name__ == '__main__':
+	main()
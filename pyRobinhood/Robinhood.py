@@ -3,6 +3,8 @@ Main class for interacting with Robinhood API, wraps the Robinhood API and
 queries.
 '''
 
+import threading
+
 from pyRobinhood.Order import Order
 from pyRobinhood.RobinhoodAPI import RobinhoodAPI
 from pyRobinhood.Endpoints import Endpoints
@@ -28,6 +30,12 @@ class Robinhood(object):
 		# The current username of the logged in user for this instance.
 		self.USERNAME = None
 
+		# (token, account url) pair cached by _account_url so the URL is only
+		# fetched once per login.
+		self._account_url_cache = None
+
+		# Background thread started by prewarm, if any.
+		self._prewarm_thread = None
 
 	'''
 	Checks if the current Robinhood instance is logged in.
@@ -78,8 +86,9 @@ class Robinhood(object):
 	def logout(self):
 		if self.logged_in():
 			headers = { 'Authorization': 'Bearer ' + self.TOKEN }
-			r = requests.post("https://api.robinhood.com/oauth2/revoke_token/",
-				headers=headers)
+			r = self._robinhood_api.session().post(
+				RobinhoodAPI.ENDPOINTS_MAP[Endpoints.LOGOUT], headers=headers,
+				timeout=self._robinhood_api.TIMEOUT)
 			if r.status_code == 200:
 				return True
 			else:
@@ -87,6 +96,32 @@ class Robinhood(object):
 		else:
 			raise NotLoggedIn()
 
+	'''
+	Warms up the client in a background thread while the caller prepares an
+	order: imports requests, opens the connection (DNS/TLS) and, if logged
+	in, fetches and caches the account URL. Failures are swallowed, the
+	foreground request simply does the work itself.
+	Returns:
+		(threading.Thread) - The started background thread.
+	'''
+	def prewarm(self):
+		thread = threading.Thread(target=self._prewarm, daemon=True)
+		self._prewarm_thread = thread
+		thread.start()
+		return thread
+
+	'''
+	Body of the prewarm thread.
+	'''
+	def _prewarm(self):
+		try:
+			if self.logged_in():
+				self._account_url()
+			else:
+				self._robinhood_api.prewarm()
+		except Exception:
+			pass
+
 	'''
 	Places an order for some security.
 	Input:
@@ -253,18 +288,30 @@ class Robinhood(object):
 			result['trading_halted'], result['updated_at'])
 
 	'''
-	Gets the account URL of the current logged in user.
+	Gets the account URL of the current logged in user. Waits for a running
+	prewarm and reuses its result when possible.
 	'''
 	def _account_url(self):
+		thread = self._prewarm_thread
+		if thread is not None and thread is not threading.current_thread():
+			thread.join(self._robinhood_api.TIMEOUT)
+
 		if self.logged_in():
+			cache = self._account_url_cache
+			if cache is not None and cache[0] == self.TOKEN:
+				return cache[1]
+
+			token = self.TOKEN
 			payload = {}
-			headers = { 'Authorization': 'Bearer ' + self.TOKEN }
+			headers = { 'Authorization': 'Bearer ' + token }
 
 			# Results returns an array of results, despite the fact that there 
 			# should be an one to one relationship for user to account url.
 			result = self._robinhood_api.query(Endpoints.ACCOUNT, payload,
 				headers)
-			return result['results'][0]['url']
+			account_url = result['results'][0]['url']
+			self._account_url_cache = (token, account_url)
+			return account_url
 
 		else:
 			raise NotLoggedIn("Need to be logged in to get account id.")
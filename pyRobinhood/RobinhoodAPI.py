@@ -1,8 +1,11 @@
 '''
 Instance that can query the Robinhood API. Understands what endpoints are authorized (and which are not). 
+
+requests is imported on first network use rather than at import time, so short
+lived scripts do not pay for it before they need it.
 '''
 
-import requests
+import threading
 
 from pyRobinhood.exceptions import APIError
 from pyRobinhood.Endpoints import Endpoints
@@ -36,6 +39,33 @@ class RobinhoodAPI(object):
 	def __init__(self, timeout):
 		self.TIMEOUT = timeout
 
+		# Created lazily by session(), reused so connections stay warm.
+		self._session = None
+		self._session_lock = threading.Lock()
+
+	'''
+	Gets the requests.Session used for all queries, importing requests and
+	creating the session on first use.
+	Returns:
+		(requests.Session)
+	'''
+	def session(self):
+		if self._session is None:
+			with self._session_lock:
+				if self._session is None:
+					import requests
+					self._session = requests.Session()
+		return self._session
+
+	'''
+	Opens a connection to the Robinhood API host so DNS resolution and the
+	TLS handshake are done before the first real query. The response itself
+	is ignored.
+	'''
+	def prewarm(self):
+		self.session().head(RobinhoodAPI.ENDPOINTS_MAP[Endpoints.ACCOUNT],
+			timeout=self.TIMEOUT)
+
 	'''
 	Queries the given endpoint with request and returns the response as a JSON
 	'''
@@ -58,18 +88,19 @@ class RobinhoodAPI(object):
 		
 		# Query the URI.
 		uri_path = RobinhoodAPI.ENDPOINTS_MAP[endpoint]
+		session = self.session()
 
 		if endpoint is Endpoints.LOGIN or endpoint is Endpoints.ORDERS: # POST requests.
-			r = requests.post(uri_path, data=payload, headers=headers, 
+			r = session.post(uri_path, data=payload, headers=headers, 
 				timeout=self.TIMEOUT)
 		elif endpoint is Endpoints.ACCOUNT or endpoint is Endpoints.BASIC_INSTRUMENT_INFO: # GET requests.
-			r = requests.get(uri_path, params=payload, headers=headers, 
+			r = session.get(uri_path, params=payload, headers=headers, 
 				timeout=self.TIMEOUT)
 		elif endpoint is Endpoints.QUOTE:
 			if 'symbol' in payload:
 				# Request through url parameter.
 				uri_path += payload['symbol']
-				r = requests.get(uri_path, headers=headers,
+				r = session.get(uri_path, headers=headers,
 					timeout=self.TIMEOUT)
 			else:
 				raise ValueError("'symbol' must be provided in payload for "\
@@ -1,3 +1,4 @@
 # Runs the tests
 python3 -m unittest tests.test_authentication
-python3 -m unittest tests.test_api_calls
\ No newline at end of file
+python3 -m unittest tests.test_api_calls
+python3 -m unittest tests.test_startup
\ No newline at end of file
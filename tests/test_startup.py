@@ -0,0 +1,22 @@
+'''
+Tests that importing and constructing the client stays cheap: heavy
+dependencies must only be loaded on first network use.
+'''
+
+import subprocess
+import sys
+import unittest
+
+class TestStartup(unittest.TestCase):
+
+	# Importing and constructing Robinhood should not import requests.
+	def test_requests_imported_lazily(self):
+		code = ("import sys\n"
+			"from pyRobinhood.Robinhood import Robinhood\n"
+			"Robinhood()\n"
+			"print('requests' in sys.modules)\n")
+		output = subprocess.check_output([sys.executable, '-c', code])
+		self.assertEqual(output.decode().strip(), "False")
+
+if __name__ == '__main__':
+	unittest.main()